@@ -72,15 +72,36 @@ Implementations
     CustomSystem
 """
 
-from ._systems import CustomSystem, TimeIndependentSystem, TimeDependentSystem
-from ._datasets import double_well_discrete, ellipsoids, position_based_fluids, drunkards_walk, bickley_jet, \
-    birth_death_chain, tmatrix_metropolis1d, sqrt_model, quadruple_well, triple_well_2d, abc_flow, ornstein_uhlenbeck, \
-    triple_well_1d, quadruple_well_asymmetric, double_well_2d, swissroll_model, prinz_potential, \
-    time_dependent_quintuple_well, lorenz_system, thomas_attractor
-from ._datasets import custom_sde, custom_ode
-from ._double_well import DoubleWellDiscrete
-from ._ellipsoids import Ellipsoids
-from ._pbf_simulator import PBFSimulator
-from ._drunkards_walk_simulator import DrunkardsWalk
-from ._bickley_simulator import BickleyJet
-from ._birth_death_chain import BirthDeathChain
+import importlib
+
+# imports are deferred (PEP 562) so that importing the package does not pay for datasets and
+# simulators which are never used
+_module_by_attribute = {
+    **{name: '._systems' for name in ('CustomSystem', 'TimeIndependentSystem', 'TimeDependentSystem')},
+    **{name: '._datasets' for name in (
+        'double_well_discrete', 'ellipsoids', 'position_based_fluids', 'drunkards_walk', 'bickley_jet',
+        'birth_death_chain', 'tmatrix_metropolis1d', 'sqrt_model', 'quadruple_well', 'triple_well_2d', 'abc_flow',
+        'ornstein_uhlenbeck', 'triple_well_1d', 'quadruple_well_asymmetric', 'double_well_2d', 'swissroll_model',
+        'prinz_potential', 'time_dependent_quintuple_well', 'lorenz_system', 'thomas_attractor',
+        'custom_sde', 'custom_ode')},
+    'DoubleWellDiscrete': '._double_well',
+    'Ellipsoids': '._ellipsoids',
+    'PBFSimulator': '._pbf_simulator',
+    'DrunkardsWalk': '._drunkards_walk_simulator',
+    'BickleyJet': '._bickley_simulator',
+    'BirthDeathChain': '._birth_death_chain'
+}
+
+__all__ = sorted(_module_by_attribute)
+
+
+def __getattr__(name):
+    if name in _module_by_attribute:
+        value = getattr(importlib.import_module(_module_by_attribute[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_module_by_attribute))
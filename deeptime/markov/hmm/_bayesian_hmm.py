@@ -578,14 +578,14 @@ class BayesianHMM(Estimator):
             # fill active states
             full_obs_probabilities[:, prior.observation_symbols] = np.maximum(eps, prior.output_probabilities)
             # renormalize B to make it row-stochastic
-            full_obs_probabilities /= full_obs_probabilities.sum(axis=1)[:, None]
+            full_obs_probabilities /= full_obs_probabilities.sum(axis=1, keepdims=True)
         else:
             full_obs_probabilities = prior.output_probabilities
 
         maxT = max(len(o) for o in dtrajs_lagged_strided)
 
         # pre-construct hidden variables
-        temp_alpha = np.zeros((maxT, prior.n_hidden_states))
+        temp_alpha = np.empty((maxT, prior.n_hidden_states))
 
         has_all_obs_symbols = model.prior.n_observation_states == len(model.prior.observation_symbols_full)
 
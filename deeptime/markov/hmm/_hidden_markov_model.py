@@ -6,7 +6,8 @@ import numpy as np
 from deeptime.base import Model
 from ._output_model import OutputModel, DiscreteOutputModel
 from deeptime.markov import sample
-from ._hmm_bindings.util import viterbi as viterbi_impl, forward as forward_impl
+from ._hmm_bindings.util import viterbi as viterbi_impl, viterbi_batch as viterbi_batch_impl, \
+    forward as forward_impl
 from ...util.types import ensure_dtraj_list, ensure_array
 from ...util.validation import ChapmanKolmogorovTest, ck_test
 
@@ -121,14 +122,14 @@ class HiddenMarkovModel(Model):
         # get parameters
         A = self.transition_model.transition_matrix
         pi = self.initial_distribution
-        alpha = np.zeros((max_n_frames, self.n_hidden_states), dtype=A.dtype)
+        alpha = np.empty((max_n_frames, self.n_hidden_states), dtype=A.dtype)
 
         # compute output probability matrix
         loglik = 0.
         for obs in data:
             T = len(obs)
             pobs = self.output_model.to_state_probability_trajectory(obs)
-            pobs = pobs.astype(A.dtype)
+            pobs = pobs.astype(A.dtype, copy=False)
             loglik += forward_impl(A, pobs, pi, alpha_out=alpha, T=T)
         return loglik
 
@@ -478,8 +479,7 @@ class HiddenMarkovModel(Model):
         state_probabilities = [
             self.output_model.to_state_probability_trajectory(obs) for obs in observations
         ]
-        paths = [viterbi(A, obs, pi) for obs in state_probabilities]
-        return paths
+        return list(viterbi_batch_impl(A, state_probabilities, pi))
 
     def collect_observations_in_state(self, observations: List[np.ndarray], state_index: int):
         """Collect a vector of all observations belonging to a specified hidden state.
@@ -1052,7 +1052,8 @@ class HiddenMarkovModel(Model):
     # ================================================================================================================
 
 
-def viterbi(transition_matrix: np.ndarray, state_probability_trajectory: np.ndarray, initial_distribution: np.ndarray):
+def viterbi(transition_matrix: np.ndarray, state_probability_trajectory: np.ndarray, initial_distribution: np.ndarray,
+            path: Optional[np.ndarray] = None):
     """ Estimate the hidden pathway of maximum likelihood using the Viterbi algorithm.
 
     Parameters
@@ -1063,6 +1064,9 @@ def viterbi(transition_matrix: np.ndarray, state_probability_trajectory: np.ndar
         pobs[t,i] is the observation probability for observation at time t given hidden state i
     initial_distribution : ndarray((N), dtype = float)
         initial distribution of hidden states
+    path : ndarray((T), dtype = int32), optional, default = None
+        preallocated container for the hidden path, avoids an allocation per call when decoding
+        repeatedly. If None, a new array is allocated.
 
     Returns
     -------
@@ -1075,4 +1079,5 @@ def viterbi(transition_matrix: np.ndarray, state_probability_trajectory: np.ndar
         state_probability_trajectory = state_probability_trajectory[..., None]
     return viterbi_impl(transition_matrix=transition_matrix,
                         state_probability_trajectory=state_probability_trajectory,
-                        initial_distribution=initial_distribution)
+                        initial_distribution=initial_distribution,
+                        path_out=path)
@@ -0,0 +1,207 @@
+r"""JAX-backed implementations of the scaled forward/backward HMM recursions.
+
+This module requires a working installation of `JAX <https://jax.readthedocs.io>`__ and is therefore not imported
+by default. The recursions are expressed via :meth:`jax.lax.scan` and jit-compiled, so that XLA fuses the per-step
+matrix-vector product, the multiplication with the observation probabilities, and the rescaling into one kernel
+per time step and can execute on an accelerator if one is visible to JAX. For very long trajectories with few
+hidden states the ``*_parallel`` variants instead evaluate the recursions through prefix products of per-step
+transfer operators with :meth:`jax.lax.associative_scan`, trading :math:`O(N^3)` work per step for
+:math:`O(\log T)` parallel depth.
+
+Note that JAX computes in float32 by default, so the results are less precise than those of the float64 compiled
+kernels unless x64 mode is enabled via ``jax.config.update('jax_enable_x64', True)``.
+"""
+
+import jax
+import jax.numpy as jnp
+
+__all__ = ['forward', 'backward', 'forward_backward', 'forward_parallel', 'backward_parallel']
+
+
+@jax.jit
+def forward(transition_matrix, state_probability_trajectory, initial_distribution):
+    r""" Computes the log-likelihood of the observation sequence and all scaled forward coefficients.
+
+    Mirrors the semantics of :meth:`deeptime.markov.hmm._hmm_bindings.util.forward`, i.e., each row of the returned
+    alpha coefficients is rescaled to sum up to one and the log-scaling factors accumulate to the log-likelihood.
+    Under JAX's default float32 configuration the results are less precise than those of the float64 compiled
+    kernel, see the module docstring.
+
+    Parameters
+    ----------
+    transition_matrix : (N, N) array
+        Transition matrix of the hidden states.
+    state_probability_trajectory : (T, N) array
+        state_probability_trajectory[t, i] is the observation probability at time t given hidden state i.
+    initial_distribution : (N,) array
+        Initial distribution of hidden states.
+
+    Returns
+    -------
+    logprob : float
+        The log-probability of the observation sequence under the model.
+    alpha : (T, N) array
+        Scaled forward coefficients.
+    """
+    alpha_init = initial_distribution * state_probability_trajectory[0]
+    scaling_init = alpha_init.sum()
+    alpha_init = alpha_init / scaling_init
+
+    def step(alpha_prev, pobs_t):
+        alpha_t = (alpha_prev @ transition_matrix) * pobs_t
+        scaling_t = alpha_t.sum()
+        alpha_t = alpha_t / scaling_t
+        return alpha_t, (alpha_t, scaling_t)
+
+    _, (alpha_tail, scaling_tail) = jax.lax.scan(step, alpha_init, state_probability_trajectory[1:])
+    logprob = jnp.log(scaling_init) + jnp.log(scaling_tail).sum()
+    return logprob, jnp.concatenate((alpha_init[None, :], alpha_tail))
+
+
+@jax.jit
+def backward(transition_matrix, state_probability_trajectory):
+    r""" Computes all scaled backward coefficients.
+
+    Parameters
+    ----------
+    transition_matrix : (N, N) array
+        Transition matrix of the hidden states.
+    state_probability_trajectory : (T, N) array
+        state_probability_trajectory[t, i] is the observation probability at time t given hidden state i.
+
+    Returns
+    -------
+    beta : (T, N) array
+        Scaled backward coefficients, each row rescaled to sum up to one.
+    """
+    n_states = transition_matrix.shape[0]
+    beta_last = jnp.ones((n_states,)) / n_states
+
+    def step(beta_next, pobs_next):
+        beta_t = transition_matrix @ (pobs_next * beta_next)
+        beta_t = beta_t / beta_t.sum()
+        return beta_t, beta_t
+
+    _, beta_head = jax.lax.scan(step, beta_last, state_probability_trajectory[1:], reverse=True)
+    return jnp.concatenate((beta_head, beta_last[None, :]))
+
+
+def forward_backward(transition_matrix, state_probability_trajectory, initial_distribution):
+    r""" Runs the forward and backward pass and returns log-likelihood together with both coefficient matrices.
+
+    Parameters
+    ----------
+    transition_matrix : (N, N) array
+        Transition matrix of the hidden states.
+    state_probability_trajectory : (T, N) array
+        state_probability_trajectory[t, i] is the observation probability at time t given hidden state i.
+    initial_distribution : (N,) array
+        Initial distribution of hidden states.
+
+    Returns
+    -------
+    logprob : float
+        The log-probability of the observation sequence under the model.
+    alpha : (T, N) array
+        Scaled forward coefficients.
+    beta : (T, N) array
+        Scaled backward coefficients.
+    """
+    logprob, alpha = forward(transition_matrix, state_probability_trajectory, initial_distribution)
+    beta = backward(transition_matrix, state_probability_trajectory)
+    return logprob, alpha, beta
+
+
+def _transfer_operators(transition_matrix, state_probability_trajectory):
+    r""" Per-step transfer operators :math:`M_t[i, j] = A[i, j] \cdot p_{\mathrm{obs}}[t, j]` for t >= 1, normalized
+    to unit total mass with the log-normalizers kept separately so that long products stay in floating-point range. """
+    mats = transition_matrix[None, :, :] * state_probability_trajectory[1:, None, :]
+    norms = mats.sum(axis=(1, 2), keepdims=True)
+    return mats / norms, jnp.log(norms[:, 0, 0])
+
+
+def _compose(x, y):
+    mats_x, log_x = x
+    mats_y, log_y = y
+    prod = mats_x @ mats_y
+    scale = prod.sum(axis=(1, 2), keepdims=True)
+    return prod / scale, log_x + log_y + jnp.log(scale[:, 0, 0])
+
+
+@jax.jit
+def forward_parallel(transition_matrix, state_probability_trajectory, initial_distribution):
+    r""" Computes the log-likelihood and all scaled forward coefficients with a parallel scan over time.
+
+    The recursion :math:`\alpha_t \propto \alpha_{t-1} M_t` with transfer operators
+    :math:`M_t = A \,\mathrm{diag}(p_{\mathrm{obs}}[t])` is associative under matrix composition, so the prefix
+    products :math:`M_1 \cdots M_t` can be evaluated via :meth:`jax.lax.associative_scan` in :math:`O(\log T)`
+    parallel depth instead of :math:`T` sequential steps. The total work grows from :math:`O(T N^2)` to
+    :math:`O(T N^3)`, so this variant only pays off for very long trajectories with few hidden states on
+    hardware with enough parallelism to hide the extra flops; otherwise prefer :meth:`forward`.
+
+    Parameters
+    ----------
+    transition_matrix : (N, N) array
+        Transition matrix of the hidden states.
+    state_probability_trajectory : (T, N) array
+        state_probability_trajectory[t, i] is the observation probability at time t given hidden state i.
+    initial_distribution : (N,) array
+        Initial distribution of hidden states.
+
+    Returns
+    -------
+    logprob : float
+        The log-probability of the observation sequence under the model.
+    alpha : (T, N) array
+        Scaled forward coefficients, identical (up to roundoff) to those of :meth:`forward`.
+    """
+    alpha_init = initial_distribution * state_probability_trajectory[0]
+    scaling_init = alpha_init.sum()
+    alpha_init = alpha_init / scaling_init
+
+    if state_probability_trajectory.shape[0] == 1:
+        # no transfer operators to scan over, only the initial step contributes
+        return jnp.log(scaling_init), alpha_init[None, :]
+
+    mats, log_norms = _transfer_operators(transition_matrix, state_probability_trajectory)
+    prefix_mats, prefix_logs = jax.lax.associative_scan(_compose, (mats, log_norms))
+
+    alpha_tail = alpha_init @ prefix_mats
+    row_sums = alpha_tail.sum(axis=1, keepdims=True)
+    logprob = jnp.log(scaling_init) + prefix_logs[-1] + jnp.log(row_sums[-1, 0])
+    return logprob, jnp.concatenate((alpha_init[None, :], alpha_tail / row_sums))
+
+
+@jax.jit
+def backward_parallel(transition_matrix, state_probability_trajectory):
+    r""" Computes all scaled backward coefficients with a parallel scan over time.
+
+    Counterpart of :meth:`forward_parallel` for the recursion :math:`\beta_t = M_{t+1} \beta_{t+1}`, evaluated
+    through suffix products of the transfer operators via a reversed :meth:`jax.lax.associative_scan`. The same
+    trade-off applies: :math:`O(\log T)` depth at :math:`O(T N^3)` work, worthwhile only for long trajectories
+    with few hidden states.
+
+    Parameters
+    ----------
+    transition_matrix : (N, N) array
+        Transition matrix of the hidden states.
+    state_probability_trajectory : (T, N) array
+        state_probability_trajectory[t, i] is the observation probability at time t given hidden state i.
+
+    Returns
+    -------
+    beta : (T, N) array
+        Scaled backward coefficients, each row rescaled to sum up to one.
+    """
+    n_states = transition_matrix.shape[0]
+    beta_last = jnp.ones((n_states,)) / n_states
+
+    mats, log_norms = _transfer_operators(transition_matrix, state_probability_trajectory)
+    # a reversed associative_scan flips the sequence, prefix-scans, and flips back without swapping the
+    # operands of the combine fn, so the operands must be exchanged here to obtain the ascending
+    # suffix products M_{t+1} ... M_{T-1} rather than the descending ones
+    suffix_mats, _ = jax.lax.associative_scan(lambda x, y: _compose(y, x), (mats, log_norms), reverse=True)
+
+    beta_head = suffix_mats @ beta_last
+    beta_head = beta_head / beta_head.sum(axis=1, keepdims=True)
+    return jnp.concatenate((beta_head, beta_last[None, :]))
@@ -6,7 +6,7 @@ from scipy.sparse import issparse
 
 from ...base import Estimator
 from .._transition_matrix import estimate_P, stationary_distribution
-from ._hidden_markov_model import HiddenMarkovModel, viterbi
+from ._hidden_markov_model import HiddenMarkovModel
 from ..msm import MarkovStateModel
 from .. import TransitionCountModel, compute_dtrajs_effective
 from ._hmm_bindings import util as _util
@@ -261,13 +261,14 @@ class MaximumLikelihoodHMM(Estimator):
         dtrajs = compute_dtrajs_effective(dtrajs, lagtime=self.lagtime, n_states=initial_model.n_hidden_states,
                                           stride=self.stride)
 
-        max_n_frames = max(len(obs) for obs in dtrajs)
-        # pre-construct hidden variables
+        # pre-construct hidden variables in a packed layout: all trajectories share one contiguous buffer,
+        # the individual sequences are row-slice views delimited by seq_offsets
         N = initial_model.n_hidden_states
-        alpha = np.zeros((max_n_frames, N))
-        beta = np.zeros((max_n_frames, N))
-        gammas = [np.zeros((len(obs), N)) for obs in dtrajs]
-        count_matrices = [np.zeros((N, N)) for _ in dtrajs]
+        seq_offsets = np.concatenate(([0], np.cumsum([len(obs) for obs in dtrajs], dtype=np.int64)))
+        obs_concat = np.concatenate(dtrajs)
+        gammas_concat = np.empty((len(obs_concat), N))
+        gammas = [gammas_concat[seq_offsets[k]:seq_offsets[k + 1]] for k in range(len(dtrajs))]
+        count_matrices = [np.empty((N, N)) for _ in dtrajs]
 
         it = 0
         likelihoods = np.empty(self.maxit)
@@ -281,10 +282,7 @@ class MaximumLikelihoodHMM(Estimator):
 
         with progress(total=self.maxit) as prog:
             while not converged and it < self.maxit:
-                loglik = 0.0
-                for obs, gamma, counts in zip(dtrajs, gammas, count_matrices):
-                    loglik_update, _ = self._forward_backward(hmm_data, obs, alpha, beta, gamma, counts)
-                    loglik += loglik_update
+                loglik = self._forward_backward(hmm_data, obs_concat, seq_offsets, gammas, count_matrices)
                 assert np.isfinite(loglik), it
 
                 # convergence check
@@ -318,10 +316,10 @@ class MaximumLikelihoodHMM(Estimator):
         count_model = TransitionCountModel(count_matrix=transition_counts, lagtime=self.lagtime)
         transition_model = MarkovStateModel(hmm_data.transition_matrix, reversible=self.reversible,
                                             count_model=count_model)
-        hidden_state_trajs = [
-            viterbi(hmm_data.transition_matrix, hmm_data.output_model.to_state_probability_trajectory(obs),
-                    hmm_data.initial_distribution) for obs in dtrajs
-        ]
+        hidden_state_trajs = list(_util.viterbi_batch(
+            hmm_data.transition_matrix,
+            [hmm_data.output_model.to_state_probability_trajectory(obs) for obs in dtrajs],
+            hmm_data.initial_distribution))
         model = HiddenMarkovModel(
             transition_model=transition_model,
             output_model=hmm_data.output_model,
@@ -336,42 +334,38 @@ class MaximumLikelihoodHMM(Estimator):
         return self
 
     @staticmethod
-    def _forward_backward(model: _HMMModelStorage, obs, alpha, beta, gamma, counts):
-        """ Estimation step: Runs the forward-back algorithm on trajectory obs
+    def _forward_backward(model: _HMMModelStorage, obs_concat, seq_offsets, gammas, count_matrices):
+        """ Estimation step: Runs the forward-backward algorithm on all trajectories, parallelized over trajectories.
 
         Parameters
         ----------
         model: _HMMModelStorage
             named tuple with transition matrix, initial distribution, output model
-        obs: np.ndarray
-            single observation corresponding to index itraj
-        alpha: ndarray
-            forward coefficients
-        beta: ndarray
-            backward coefficients
-        gamma: ndarray
-            gammas
-        counts: ndarray
-            count matrix
+        obs_concat: np.ndarray
+            all observation trajectories concatenated into one contiguous array
+        seq_offsets: ndarray
+            sequence boundaries within obs_concat, i.e., trajectory k occupies
+            obs_concat[seq_offsets[k]:seq_offsets[k + 1]]
+        gammas: list of ndarray
+            state probability arrays, one per trajectory, updated in-place
+        count_matrices: list of ndarray
+            count matrices, one per trajectory, updated in-place
 
         Returns
         -------
         logprob : float
-            The probability to observe the observation sequence given the HMM
+            The probability to observe the observation sequences given the HMM
             parameters
-        pobs : ndarray
-            state probability trajectory obtained from obs
         """
         # get parameters
         A = model.transition_matrix
         pi = model.initial_distribution
-        T = len(obs)
-        # compute output probability matrix
-        pobs = model.output_model.to_state_probability_trajectory(obs)
-        pobs = pobs.astype(A.dtype)
-        # run forward - backward pass
-        logprob = _util.forward_backward(A, pobs, pi, alpha, beta, gamma, counts, T)
-        return logprob, pobs
+        # compute the output probability matrix for all frames at once and slice it per trajectory
+        pobs_concat = model.output_model.to_state_probability_trajectory(obs_concat).astype(A.dtype, copy=False)
+        pobs = [pobs_concat[seq_offsets[k]:seq_offsets[k + 1]] for k in range(len(gammas))]
+        # run forward - backward passes
+        logprobs = _util.forward_backward_batch(A, pobs, pi, gammas, count_matrices)
+        return np.sum(logprobs)
 
     def _init_counts(self, gammas):
         gamma0_sum = np.zeros(self.n_hidden_states)
@@ -415,7 +409,7 @@ class MaximumLikelihoodHMM(Estimator):
         else:
             if self.fixed_initial_distribution is None:
                 gamma0_sum = self._init_counts(gammas)
-                pi = gamma0_sum / np.sum(gamma0_sum)
+                pi = np.divide(gamma0_sum, np.sum(gamma0_sum), out=gamma0_sum)
             else:
                 pi = self.fixed_initial_distribution
 
@@ -262,7 +262,7 @@ class DiscreteOutputModel(OutputModel):
 
     def normalize(self):
         r""" Normalizes output probabilities so they are row-stochastic. """
-        self._output_probabilities /= np.sum(self._output_probabilities, axis=1)[:, None]
+        self._output_probabilities /= self._output_probabilities.sum(axis=1, keepdims=True)
 
     def submodel(self, states: Optional[np.ndarray] = None, obs: Optional[np.ndarray] = None):
         if states is None:
@@ -270,7 +270,7 @@ class DiscreteOutputModel(OutputModel):
         if obs is None:
             obs = np.arange(self.output_probabilities.shape[1])
         B = np.copy(self.output_probabilities[np.ix_(states, obs)])
-        B /= B.sum(axis=1)[:, None]
+        B /= B.sum(axis=1, keepdims=True)
         if self.prior is not None:
             prior = np.copy(self.prior[np.ix_(states, obs)])
         else:
@@ -43,7 +43,8 @@ def sample_hidden_state_trajectory(transition_matrix, output_model, initial_dist
     T = obs.shape[0]
 
     if temp_alpha is None:
-        temp_alpha = np.zeros((obs.shape[0], transition_matrix.shape[0]), dtype=transition_matrix.dtype)
+        # no zero-init required, the forward pass overwrites every entry that is read later on
+        temp_alpha = np.empty((obs.shape[0], transition_matrix.shape[0]), dtype=transition_matrix.dtype)
 
     # compute output probability matrix
     pobs = output_model.to_state_probability_trajectory(obs)
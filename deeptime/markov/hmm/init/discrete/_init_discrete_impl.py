@@ -51,7 +51,7 @@ def _regularize_hidden(initial_distribution, transition_matrix, reversible=True,
     # REGULARIZE P
     transition_matrix = np.maximum(transition_matrix, eps)
     # and renormalize
-    transition_matrix /= transition_matrix.sum(axis=1)[:, None]
+    transition_matrix /= transition_matrix.sum(axis=1, keepdims=True)
     # ensure reversibility
     if reversible:
         from deeptime.markov._transition_matrix import enforce_reversible_on_closed
@@ -111,7 +111,7 @@ def _regularize_pobs(output_probabilities, nonempty=None, separate=None, eps=Non
         output_probabilities[n - 1, nonempty_separate] = np.maximum(output_probabilities[n - 1, nonempty_separate], eps)
 
     # renormalize and return copy
-    output_probabilities /= output_probabilities.sum(axis=1)[:, None]
+    output_probabilities /= output_probabilities.sum(axis=1, keepdims=True)
     return output_probabilities
 
 
@@ -144,7 +144,7 @@ def _coarse_grain_transition_matrix(P, M):
     # this coarse-graining can lead to negative elements. Setting them to zero here.
     P_coarse = np.maximum(P_coarse, 0)
     # and renormalize
-    P_coarse /= P_coarse.sum(axis=1)[:, None]
+    P_coarse /= P_coarse.sum(axis=1, keepdims=True)
 
     return P_coarse
 
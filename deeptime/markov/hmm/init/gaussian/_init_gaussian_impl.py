@@ -53,7 +53,7 @@ def from_data(trajs, n_hidden_states, reversible, transition_matrix_kwargs=None)
         # output probability
         pobs = output_model.to_state_probability_trajectory(o_t)
         # normalize
-        pobs /= pobs.sum(axis=1)[:, None]
+        pobs /= pobs.sum(axis=1, keepdims=True)
         # Accumulate fractional transition counts from this trajectory.
         for t in range(T - 1):
             Nij += np.outer(pobs[t, :], pobs[t + 1, :])
@@ -66,8 +66,10 @@ PYBIND11_MODULE(_hmm_bindings, m) {
     }
     {
         auto util = m.def_submodule("util");
-        util.def("viterbi", &viterbiPath<float>, "transition_matrix"_a, "state_probability_trajectory"_a, "initial_distribution"_a, docs::VITERBI);
-        util.def("viterbi", &viterbiPath<double>, "transition_matrix"_a, "state_probability_trajectory"_a, "initial_distribution"_a, docs::VITERBI);
+        util.def("viterbi", &viterbiPath<float>, "transition_matrix"_a, "state_probability_trajectory"_a, "initial_distribution"_a, "path_out"_a = py::none(), docs::VITERBI);
+        util.def("viterbi", &viterbiPath<double>, "transition_matrix"_a, "state_probability_trajectory"_a, "initial_distribution"_a, "path_out"_a = py::none(), docs::VITERBI);
+        util.def("viterbi_batch", &viterbiPathBatch<float>, "transition_matrix"_a, "state_probability_trajectories"_a, "initial_distribution"_a, docs::VITERBI_BATCH);
+        util.def("viterbi_batch", &viterbiPathBatch<double>, "transition_matrix"_a, "state_probability_trajectories"_a, "initial_distribution"_a, docs::VITERBI_BATCH);
         util.def("forward", &forward<float>, "transition_matrix"_a, "state_probability_trajectory"_a, "initial_distribution"_a, "alpha_out"_a, "T"_a = py::none(), docs::FORWARD);
         util.def("forward", &forward<double>, "transition_matrix"_a, "state_probability_trajectory"_a, "initial_distribution"_a, "alpha_out"_a, "T"_a = py::none(), docs::FORWARD);
         util.def("backward", &backward<float>, "transition_matrix"_a, "state_probability_trajectory"_a, "beta_out"_a, "T"_a = py::none(), docs::BACKWARD);
@@ -76,10 +78,12 @@ PYBIND11_MODULE(_hmm_bindings, m) {
         util.def("state_probabilities", &stateProbabilities<double>, "alpha"_a, "beta"_a, "gamma_out"_a, "T"_a = py::none(), docs::STATE_PROBS);
         util.def("transition_counts", &transitionCounts<float>, "alpha"_a, "beta"_a, "transition_matrix"_a, "state_probability_trajectory"_a, "counts_out"_a, "T"_a = py::none(), docs::TRANSITION_COUNTS);
         util.def("transition_counts", &transitionCounts<double>, "alpha"_a, "beta"_a, "transition_matrix"_a, "state_probability_trajectory"_a, "counts_out"_a, "T"_a = py::none(), docs::TRANSITION_COUNTS);
-        util.def("sample_path", &samplePath<float>, "alpha"_a, "transition_matrix"_a, "T"_a , "seed"_a = -1, docs::SAMPLE_PATH);
-        util.def("sample_path", &samplePath<double>, "alpha"_a, "transition_matrix"_a, "T"_a, "seed"_a = -1, docs::SAMPLE_PATH);
+        util.def("sample_path", &samplePath<float>, "alpha"_a, "transition_matrix"_a, "T"_a , "seed"_a = -1, "path_out"_a = py::none(), docs::SAMPLE_PATH);
+        util.def("sample_path", &samplePath<double>, "alpha"_a, "transition_matrix"_a, "T"_a, "seed"_a = -1, "path_out"_a = py::none(), docs::SAMPLE_PATH);
         util.def("count_matrix", &countMatrix<std::int32_t>, "dtrajs"_a, "lag"_a, "n_states"_a);
         util.def("forward_backward", &forwardBackward<float>, "transition_matrix"_a, "pObs"_a, "pi"_a, "alpha"_a, "beta"_a, "gamma"_a, "counts"_a, "T"_a);
         util.def("forward_backward", &forwardBackward<double>, "transition_matrix"_a, "pObs"_a, "pi"_a, "alpha"_a, "beta"_a, "gamma"_a, "counts"_a, "T"_a);
+        util.def("forward_backward_batch", &forwardBackwardBatch<float>, "transition_matrix"_a, "pObs"_a, "pi"_a, "gammas"_a, "counts"_a);
+        util.def("forward_backward_batch", &forwardBackwardBatch<double>, "transition_matrix"_a, "pObs"_a, "pi"_a, "gammas"_a, "counts"_a);
     }
 }
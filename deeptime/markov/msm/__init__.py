@@ -33,14 +33,45 @@ Augmented markov models (AMMs)
     AugmentedMSM
     AMMOptimizerState
 """
+import importlib
 import logging
 
-from ._markov_state_model import MarkovStateModel, MarkovStateModelCollection
-from ._maximum_likelihood_msm import MaximumLikelihoodMSM
-from ._bayesian_msm import BayesianMSM, BayesianMSMPosterior
-from ._koopman_reweighted_msm import KoopmanReweightedMSM, OOMReweightedMSM
-from ._augmented_msm import AugmentedMSMEstimator, AugmentedMSM, AMMOptimizerState
-from .tram import TRAM, TRAMDataset, TRAMModel
+# imports are deferred (PEP 562) so that importing the package does not pay for estimators
+# which are never used
+_module_by_attribute = {
+    'MarkovStateModel': '._markov_state_model',
+    'MarkovStateModelCollection': '._markov_state_model',
+    'MaximumLikelihoodMSM': '._maximum_likelihood_msm',
+    'BayesianMSM': '._bayesian_msm',
+    'BayesianMSMPosterior': '._bayesian_msm',
+    'KoopmanReweightedMSM': '._koopman_reweighted_msm',
+    'OOMReweightedMSM': '._koopman_reweighted_msm',
+    'AugmentedMSMEstimator': '._augmented_msm',
+    'AugmentedMSM': '._augmented_msm',
+    'AMMOptimizerState': '._augmented_msm',
+    'TRAM': '.tram',
+    'TRAMDataset': '.tram',
+    'TRAMModel': '.tram'
+}
+
+__all__ = sorted(_module_by_attribute)
+
+
+def __getattr__(name):
+    if name == 'tram':
+        # the former eager 'from .tram import ...' bound the subpackage as a module attribute, keep that working
+        value = importlib.import_module('.tram', __name__)
+    elif name in _module_by_attribute:
+        value = getattr(importlib.import_module(_module_by_attribute[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_module_by_attribute) | {'tram'})
+
 
 # set up null handler
 logging.getLogger(__name__).addHandler(logging.NullHandler())
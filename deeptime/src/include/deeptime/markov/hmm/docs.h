@@ -92,6 +92,9 @@ state_probability_trajectory : ndarray((T,N), dtype = float)
     pobs[t,i] is the observation probability for observation at time t given hidden state i
 initial_distribution : ndarray((N), dtype = float)
     initial distribution of hidden states
+path_out : ndarray((T), dtype = int32), optional, default = None
+    preallocated container for the hidden path. Every entry is overwritten, so it need not be
+    initialized. If None, a new array is allocated.
 
 Returns
 -------
@@ -99,6 +102,25 @@ q : numpy.array shape (T)
     maximum likelihood hidden path
 )mydelim";
 
+static constexpr const char* VITERBI_BATCH = R"mydelim(Estimate the hidden pathways of maximum likelihood for a batch of trajectories.
+
+The trajectories are assumed to be independent realizations of the same model; they are processed in parallel.
+
+Parameters
+----------
+transition_matrix : ndarray((N,N), dtype = float)
+    transition matrix of the hidden states
+state_probability_trajectories : list of ndarray((T_k,N), dtype = float)
+    per trajectory, pobs[t,i] is the observation probability for observation at time t given hidden state i
+initial_distribution : ndarray((N), dtype = float)
+    initial distribution of hidden states
+
+Returns
+-------
+q : list of numpy.array with shapes (T_k,)
+    maximum likelihood hidden paths
+)mydelim";
+
 static constexpr const char* SAMPLE_PATH = R"mydelim(Sample the hidden pathway S from the conditional distribution P ( S | Parameters, Observations )
 
 Parameters
@@ -114,6 +136,9 @@ T : int, optional, default=None
 seed: int, optional, default = -1
     seed for libc.stdlib.srand, if -1 is given, the random number generation will be initialized
     with the current time (seconds).
+path_out : ndarray((T), dtype = int32), optional, default = None
+    preallocated container for the sampled path. Every entry is overwritten, so it need not be
+    initialized. If None, a new array is allocated.
 
 Returns
 -------
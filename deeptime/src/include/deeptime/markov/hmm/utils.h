@@ -4,6 +4,7 @@
 
 #pragma once
 
+#include <limits>
 #include <thread>
 
 #include <deeptime/common.h>
@@ -11,104 +12,201 @@
 
 namespace deeptime::markov::hmm {
 
+template<typename dtype, typename BackPointer>
+void viterbiImpl(const dtype* const ABuf, const dtype* const pobsBuf, const dtype* const piBuf,
+                 std::int32_t* const pathBuf, std::size_t N, std::size_t T) {
+    // the recursion is carried out in log space where it becomes a max-plus matrix product; this needs
+    // neither the per-step rescale of the probability-space formulation nor any divisions, and zero
+    // probabilities map to -inf which behaves correctly under max
+    auto logAData = std::unique_ptr<dtype[]>(new dtype[N * N]);
+    auto logA = logAData.get();
+    for (std::size_t i = 0; i < N * N; i++) {
+        logA[i] = std::log(ABuf[i]);
+    }
+    auto vData = std::unique_ptr<dtype[]>(new dtype[N]);
+    auto v = vData.get();
+    auto vnextData = std::unique_ptr<dtype[]>(new dtype[N]);
+    auto vnext = vnextData.get();
+    auto pathTmpBuf = std::unique_ptr<BackPointer[]>(new BackPointer[T * N]);
+    auto ptr = pathTmpBuf.get();
+
+    // initialization of v
+    for (std::size_t i = 0; i < N; i++) {
+        v[i] = std::log(pobsBuf[i]) + std::log(piBuf[i]);
+    }
+
+    // iteration of v
+    for (std::size_t t = 1; t < T; t++) {
+        auto* bestIdx = ptr + t * N;
+        std::fill(bestIdx, bestIdx + N, static_cast<BackPointer>(0));
+        // seed the column maxima with source state 0, then sweep the remaining rows with
+        // unit stride so that max and argmax are tracked without an inner argmax scan
+        for (std::size_t j = 0; j < N; j++) {
+            vnext[j] = v[0] + logA[j];
+        }
+        for (std::size_t i = 1; i < N; i++) {
+            const auto vi = v[i];
+            const auto* row = logA + i * N;
+            for (std::size_t j = 0; j < N; j++) {
+                const auto candidate = vi + row[j];
+                if (candidate > vnext[j]) {
+                    vnext[j] = candidate;
+                    bestIdx[j] = static_cast<BackPointer>(i);
+                }
+            }
+        }
+        const auto* pobsRow = pobsBuf + t * N;
+        for (std::size_t j = 0; j < N; j++) {
+            vnext[j] += std::log(pobsRow[j]);
+        }
+        // update v
+        std::swap(v, vnext);
+    }
+
+    // path reconstruction
+    pathBuf[T - 1] = std::distance(v, std::max_element(v, v + N));
+    for (std::size_t t = T - 1; t >= 1; t--) {
+        pathBuf[t - 1] = static_cast<std::int32_t>(ptr[t * N + pathBuf[t]]);
+    }
+}
+
+template<typename dtype>
+void viterbiImpl(const dtype* const ABuf, const dtype* const pobsBuf, const dtype* const piBuf,
+                 std::int32_t* const pathBuf, std::size_t N, std::size_t T) {
+    // 16-bit backpointers halve the footprint and bandwidth of the (T, N) backtracking table
+    // and are sufficient for all but absurdly large hidden state spaces
+    if (N <= static_cast<std::size_t>(std::numeric_limits<std::uint16_t>::max())) {
+        viterbiImpl<dtype, std::uint16_t>(ABuf, pobsBuf, piBuf, pathBuf, N, T);
+    } else {
+        viterbiImpl<dtype, std::int32_t>(ABuf, pobsBuf, piBuf, pathBuf, N, T);
+    }
+}
+
+namespace detail {
+template<typename dtype>
+void checkViterbiShapes(const np_array<dtype> &transitionMatrix, const np_array<dtype> &stateProbabilityTraj,
+                        const np_array<dtype> &initialDistribution) {
+    if (transitionMatrix.ndim() < 1 || stateProbabilityTraj.ndim() < 1) {
+        throw std::invalid_argument("transition matrix and pobs need to be at least 1-dimensional.");
+    }
+    auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
+    auto T = static_cast<std::size_t>(stateProbabilityTraj.shape(0));
+    if (transitionMatrix.ndim() != 2) throw std::invalid_argument("transition matrix must be 2-dimensional");
+    if (transitionMatrix.shape(1) != transitionMatrix.shape(0)) {
+        throw std::invalid_argument("Transition matrix must be (N, N) but was (" + std::to_string(N) + ", " +
+                                    std::to_string(transitionMatrix.shape(1)) + ")");
+    }
+    if (stateProbabilityTraj.ndim() != 2) throw std::invalid_argument("pobs must be 2-dimensional");
+    if (static_cast<std::size_t>(stateProbabilityTraj.shape(1)) != N) {
+        std::stringstream ss;
+        ss << "State probablity trajectory must be (T, N) = (" << T << ", " << N << ") dimensional but was (";
+        ss << stateProbabilityTraj.shape(0) << ", " << stateProbabilityTraj.shape(1) << ")";
+        throw std::invalid_argument(ss.str());
+    }
+    if (initialDistribution.ndim() != 1) throw std::invalid_argument("initial distribution must be 1-dimensional");
+    if (static_cast<std::size_t>(initialDistribution.shape(0)) != N) {
+        throw std::invalid_argument(
+                "initial distribution must have length N = " + std::to_string(N) + " but had len=" +
+                std::to_string(initialDistribution.shape(0)));
+    }
+    if (T == 0 || N == 0) {
+        throw std::invalid_argument("Needs T and N to be at least 1, i.e., no empty arrays permitted.");
+    }
+}
+
+inline np_array_nfc<std::int32_t> pathOutputArray(const py::object &pathOut, std::size_t T) {
+    if (pathOut.is_none()) {
+        return np_array_nfc<std::int32_t>(std::vector<std::size_t>{T});
+    }
+    // no forcecast here: a converting cast would write the result into a silent copy rather than
+    // into the caller-provided buffer
+    if (!py::isinstance<np_array_nfc<std::int32_t>>(pathOut)) {
+        throw std::invalid_argument("path_out must be a C-contiguous int32 ndarray.");
+    }
+    auto path = pathOut.cast<np_array_nfc<std::int32_t>>();
+    if (path.ndim() != 1 || static_cast<std::size_t>(path.shape(0)) != T) {
+        throw std::invalid_argument("path_out must be one-dimensional with length T=" + std::to_string(T) + ".");
+    }
+    return path;
+}
+}
+
 /**
  * computes viterbi path
  * @tparam dtype dtype
  * @param transitionMatrix (N, N) transition matrix
  * @param stateProbabilityTraj (T, N) pobs
  * @param initialDistribution (N,) init dist
+ * @param pathOut optional preallocated (T,) int32 output buffer, a fresh array is allocated if none
  * @return (T, )ndarray
  */
 template<typename dtype>
-np_array<std::int32_t> viterbiPath(const np_array<dtype> &transitionMatrix, const np_array<dtype> &stateProbabilityTraj,
-                                   const np_array<dtype> &initialDistribution) {
-    if (transitionMatrix.ndim() < 1 || stateProbabilityTraj.ndim() < 1) {
-        throw std::invalid_argument("transition matrix and pobs need to be at least 1-dimensional.");
-    }
+np_array_nfc<std::int32_t> viterbiPath(const np_array<dtype> &transitionMatrix,
+                                       const np_array<dtype> &stateProbabilityTraj,
+                                       const np_array<dtype> &initialDistribution,
+                                       const py::object &pathOut = py::none()) {
+    detail::checkViterbiShapes(transitionMatrix, stateProbabilityTraj, initialDistribution);
     auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
     auto T = static_cast<std::size_t>(stateProbabilityTraj.shape(0));
+    auto path = detail::pathOutputArray(pathOut, T);
+    const auto* ABuf = transitionMatrix.data();
+    const auto* pobsBuf = stateProbabilityTraj.data();
+    const auto* piBuf = initialDistribution.data();
+    auto* pathBuf = path.mutable_data();
     {
-        // check shapes
-        if (transitionMatrix.ndim() != 2) throw std::invalid_argument("transition matrix must be 2-dimensional");
-        if (transitionMatrix.shape(1) != transitionMatrix.shape(0)) {
-            throw std::invalid_argument("Transition matrix must be (N, N) but was (" + std::to_string(N) + ", " +
-                                        std::to_string(transitionMatrix.shape(1)) + ")");
-        }
-        if (stateProbabilityTraj.ndim() != 2) throw std::invalid_argument("pobs must be 2-dimensional");
-        if (static_cast<std::size_t>(stateProbabilityTraj.shape(1)) != N) {
-            std::stringstream ss;
-            ss << "State probablity trajectory must be (T, N) = (" << T << ", " << N << ") dimensional but was (";
-            ss << stateProbabilityTraj.shape(0) << ", " << stateProbabilityTraj.shape(1) << ")";
-            throw std::invalid_argument(ss.str());
-        }
-        if (initialDistribution.ndim() != 1) throw std::invalid_argument("initial distribution must be 1-dimensional");
-        if (static_cast<std::size_t>(initialDistribution.shape(0)) != N) {
-            throw std::invalid_argument(
-                    "initial distribution must have length N = " + std::to_string(N) + " but had len=" +
-                    std::to_string(initialDistribution.shape(0)));
-        }
-        if (T == 0 || N == 0) {
-            throw std::invalid_argument("Needs T and N to be at least 1, i.e., no empty arrays permitted.");
-        }
-    }
-    np_array<std::int32_t> path(std::vector<std::size_t>{T});
-    auto pathBuf = path.mutable_data();
-    auto ABuf = transitionMatrix.data();
-    auto pobsBuf = stateProbabilityTraj.data();
-    auto piBuf = initialDistribution.data();
-    {
-        std::fill(pathBuf, pathBuf + T, 0);
-
-        dtype sum;
-        auto vData = std::unique_ptr<dtype[]>(new dtype[N]);
-        auto v = vData.get();
-        auto vnextData = std::unique_ptr<dtype[]>(new dtype[N]);
-        auto vnext = vnextData.get();
-        auto hData = std::unique_ptr<dtype[]>(new dtype[N]);
-        auto h = hData.get();
-        auto pathTmpBuf = std::unique_ptr<std::int32_t[]>(new std::int32_t[T * N]);
-        auto ptr = pathTmpBuf.get();
-
-        // initialization of v
-        sum = 0.0;
-        for (std::size_t i = 0; i < N; i++) {
-            v[i] = pobsBuf[i] * piBuf[i];
-            sum += v[i];
-        }
-        // normalize
-        for (std::size_t i = 0; i < N; i++) {
-            v[i] /= sum;
-        }
-
-        // iteration of v
-        for (std::size_t t = 1; t < T; t++) {
-            sum = 0.0;
-            for (std::size_t j = 0; j < N; j++) {
-                for (std::size_t i = 0; i < N; i++) {
-                    h[i] = v[i] * ABuf[i * N + j];
-                }
-                auto maxi = std::distance(h, std::max_element(h, h + N));
-                ptr[t * N + j] = maxi;
-                vnext[j] = pobsBuf[t * N + j] * v[maxi] * ABuf[maxi * N + j];
-                sum += vnext[j];
-            }
-            // normalize
-            for (std::size_t i = 0; i < N; i++) {
-                vnext[i] /= sum;
-            }
-            // update v
-            std::swap(v, vnext);
-        }
+        py::gil_scoped_release gil;
+        viterbiImpl(ABuf, pobsBuf, piBuf, pathBuf, N, T);
+    }
+    return path;
+}
 
-        // path reconstruction
-        pathBuf[T - 1] = std::distance(v, std::max_element(v, v + N));
-        for (std::size_t t = T - 1; t >= 1; t--) {
-            pathBuf[t - 1] = ptr[t * N + pathBuf[t]];
+/**
+ * computes viterbi paths for a batch of independent trajectories, parallelized over trajectories
+ * @tparam dtype dtype
+ * @param transitionMatrix (N, N) transition matrix
+ * @param stateProbabilityTrajs list of (T_k, N) pobs
+ * @param initialDistribution (N,) init dist
+ * @return list of (T_k,) ndarrays
+ */
+template<typename dtype>
+py::list viterbiPathBatch(const np_array<dtype> &transitionMatrix, const py::list &stateProbabilityTrajs,
+                          const np_array<dtype> &initialDistribution) {
+    auto nTrajs = stateProbabilityTrajs.size();
+    std::vector<np_array<dtype>> pobsArrays;
+    std::vector<np_array<std::int32_t>> pathArrays;
+    pobsArrays.reserve(nTrajs);
+    pathArrays.reserve(nTrajs);
+    for (std::size_t k = 0; k < nTrajs; ++k) {
+        pobsArrays.push_back(stateProbabilityTrajs[k].cast<np_array<dtype>>());
+        detail::checkViterbiShapes(transitionMatrix, pobsArrays.back(), initialDistribution);
+        pathArrays.emplace_back(std::vector<std::size_t>{static_cast<std::size_t>(pobsArrays.back().shape(0))});
+    }
+    auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
+    std::vector<const dtype*> pobsBufs(nTrajs);
+    std::vector<std::int32_t*> pathBufs(nTrajs);
+    std::vector<std::size_t> lengths(nTrajs);
+    for (std::size_t k = 0; k < nTrajs; ++k) {
+        pobsBufs[k] = pobsArrays[k].data();
+        pathBufs[k] = pathArrays[k].mutable_data();
+        lengths[k] = static_cast<std::size_t>(pobsArrays[k].shape(0));
+    }
+    const auto* ABuf = transitionMatrix.data();
+    const auto* piBuf = initialDistribution.data();
+    {
+        py::gil_scoped_release gil;
+        const dtype* const* pobsPtrs = pobsBufs.data();
+        std::int32_t* const* pathPtrs = pathBufs.data();
+        const std::size_t* lengthsPtr = lengths.data();
+        #pragma omp parallel for default(none) firstprivate(nTrajs, N, ABuf, piBuf, pobsPtrs, pathPtrs, lengthsPtr)
+        for (std::size_t k = 0; k < nTrajs; ++k) {
+            viterbiImpl(ABuf, pobsPtrs[k], piBuf, pathPtrs[k], N, lengthsPtr[k]);
         }
-
-
     }
-    return path;
+    py::list paths;
+    for (std::size_t k = 0; k < nTrajs; ++k) {
+        paths.append(pathArrays[k]);
+    }
+    return paths;
 }
 
 template<typename dtype>
@@ -130,30 +228,38 @@ dtype forwardImpl(const dtype*const  transitionMatrix, const dtype*const  pObs,
 
         // scale first alpha
         if (scaling != 0) {
-            //#pragma omp parallel for default(none) firstprivate(N, alpha, scaling)
+            const auto invScaling = static_cast<dtype>(1) / scaling;
+            //#pragma omp parallel for default(none) firstprivate(N, alpha, invScaling)
             for (std::size_t i = 0; i < N; i++) {
-                alpha[i] /= scaling;
+                alpha[i] *= invScaling;
             }
         }
 
         // iterate trajectory
         for (std::size_t t = 0; t < T - 1; t++) {
+            const auto* alphaPrev = alpha + t * N;
+            auto* alphaNext = alpha + (t + 1) * N;
+            // accumulate the matvec row by row so that the inner loop runs with unit stride over the
+            // transition matrix, which lets the compiler vectorize the fused multiply-adds
+            std::fill(alphaNext, alphaNext + N, static_cast<dtype>(0));
+            for (std::size_t i = 0; i < N; i++) {
+                const auto alphaPrevI = alphaPrev[i];
+                const auto* row = transitionMatrix + i * N;
+                for (std::size_t j = 0; j < N; j++) {
+                    alphaNext[j] += alphaPrevI * row[j];
+                }
+            }
+            // multiply with observation probabilities and compute scaling
             scaling = 0.0;
-            // compute new alpha and scaling
-            //#pragma omp parallel for reduction(+:scaling) default(none) firstprivate(N, alpha, transitionMatrix, pObs, t)
             for (std::size_t j = 0; j < N; j++) {
-                dtype sum = 0.0;
-                for (std::size_t i = 0; i < N; i++) {
-                    sum += alpha[t * N + i] * transitionMatrix[i * N + j];
-                }
-                alpha[(t + 1) * N + j] = sum * pObs[(t + 1) * N + j];
-                scaling += alpha[(t + 1) * N + j];
+                alphaNext[j] *= pObs[(t + 1) * N + j];
+                scaling += alphaNext[j];
             }
             // scale this row
             if (scaling != 0) {
-                //#pragma omp parallel for default(none) firstprivate(N, alpha, scaling, t)
+                const auto invScaling = static_cast<dtype>(1) / scaling;
                 for (std::size_t j = 0; j < N; j++) {
-                    alpha[(t + 1) * N + j] /= scaling;
+                    alphaNext[j] *= invScaling;
                 }
             }
 
@@ -184,7 +290,12 @@ dtype forward(const np_array<dtype> &transitionMatrix, const np_array<dtype> &pO
         throw std::invalid_argument("Shape mismatch: Shape of state probability trajectory must match shape of alphas");
     }
     auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
-    return forwardImpl(transitionMatrix.data(), pObs.data(), pi.data(), alpha.mutable_data(), N, T);
+    const auto* ABuf = transitionMatrix.data();
+    const auto* pObsBuf = pObs.data();
+    const auto* piBuf = pi.data();
+    auto* alphaBuf = alpha.mutable_data();
+    py::gil_scoped_release gil;
+    return forwardImpl(ABuf, pObsBuf, piBuf, alphaBuf, N, T);
 }
 
 template<typename dtype>
@@ -202,26 +313,41 @@ void backwardImpl(const dtype* const transitionMatrix, const dtype* const pobs,
         }
 
         // scale first beta
-        for (i = 0; i < N; ++i) {
-            beta[(T - 1) * N + i] /= scaling;
+        {
+            const auto invScaling = static_cast<dtype>(1) / scaling;
+            for (i = 0; i < N; ++i) {
+                beta[(T - 1) * N + i] *= invScaling;
+            }
         }
 
+        // scratch row for the elementwise product pobs[t] * beta[t], stays L1-resident across the i-loop
+        auto tmpData = std::unique_ptr<dtype[]>(new dtype[N]);
+        auto* tmp = tmpData.get();
+
         // iterate trajectory
         for (t = T - 1; t >= 1; --t) {
+            const auto* pobsRow = pobs + t * N;
+            const auto* betaNext = beta + t * N;
+            auto* betaPrev = beta + (t - 1) * N;
+            for (j = 0; j < N; ++j) {
+                tmp[j] = pobsRow[j] * betaNext[j];
+            }
             scaling = 0.0;
             // compute new beta and scaling
             for (i = 0; i < N; ++i) {
                 sum = 0.0;
+                const auto* row = transitionMatrix + i * N;
                 for (j = 0; j < N; ++j) {
-                    sum += transitionMatrix[i * N + j] * pobs[t * N + j] * beta[t * N + j];
+                    sum += row[j] * tmp[j];
                 }
-                beta[(t - 1) * N + i] = sum;
+                betaPrev[i] = sum;
                 scaling += sum;
             }
             // scale this row
             if (scaling != 0) {
+                const auto invScaling = static_cast<dtype>(1) / scaling;
                 for (j = 0; j < N; ++j) {
-                    beta[(t - 1) * N + j] /= scaling;
+                    betaPrev[j] *= invScaling;
                 }
             }
         }
@@ -245,8 +371,11 @@ void backward(const np_array<dtype> &transitionMatrix, const np_array<dtype> &po
     }
 
     auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
-
-    backwardImpl(transitionMatrix.data(), pobs.data(), beta.mutable_data(), N, T);
+    const auto* ABuf = transitionMatrix.data();
+    const auto* pobsBuf = pobs.data();
+    auto* betaBuf = beta.mutable_data();
+    py::gil_scoped_release gil;
+    backwardImpl(ABuf, pobsBuf, betaBuf, N, T);
 }
 
 template<typename dtype>
@@ -259,9 +388,10 @@ void stateProbabilitiesImpl(const dtype* const alpha, const dtype* const beta, d
             *(gamma + t * N + n) = *(alpha + t * N + n) * *(beta + t * N + n);
             rowSum += gamma[t * N + n];
         }
-        for (std::size_t n = 0; n < N; ++n) {
-            if (rowSum != 0.) {
-                gamma[t * N + n] /= rowSum;
+        if (rowSum != 0.) {
+            const auto invRowSum = static_cast<dtype>(1) / rowSum;
+            for (std::size_t n = 0; n < N; ++n) {
+                gamma[t * N + n] *= invRowSum;
             }
         }
     }
@@ -281,31 +411,113 @@ void stateProbabilities(const np_array<dtype> &alpha, const np_array<dtype> &bet
     auto alphaPtr = alpha.data();
     auto betaPtr = beta.data();
     auto gammaPtr = gamma.mutable_data();
+    py::gil_scoped_release gil;
     stateProbabilitiesImpl(alphaPtr, betaPtr, gammaPtr, N, T);
 }
 
 template<typename dtype>
 void transitionCountsImpl(const dtype* const alpha, const dtype* const beta, const dtype* const transitionMatrix,
                           const dtype* const pObs, dtype* const counts, std::size_t N, std::size_t T) {
-    std::fill(counts, counts + N*N, 0.0);
+    std::fill(counts, counts + N * N, 0.0);
 
-    dtype sum;
+    auto wData = std::unique_ptr<dtype[]>(new dtype[N]);
+    auto* w = wData.get();
 
-    std::unique_ptr<dtype[]> tmp = std::unique_ptr<dtype[]>(new dtype[N * N]);
+    for (std::size_t t = 0; t < T - 1; t++) {
+        const auto* alphaRow = alpha + t * N;
+        const auto* pObsNext = pObs + (t + 1) * N;
+        const auto* betaNext = beta + (t + 1) * N;
+        // the update has rank-1 structure, outer(alpha[t], pobs[t+1]*beta[t+1]) * A elementwise;
+        // forming the weight row once avoids recomputing the product for every i
+        for (std::size_t j = 0; j < N; j++) {
+            w[j] = pObsNext[j] * betaNext[j];
+        }
+        // the normalizer is obtained from per-row dot products first, so that the second pass can
+        // accumulate the scaled update directly into counts without an (N, N) temporary
+        dtype sum = 0.0;
+        for (std::size_t i = 0; i < N; i++) {
+            const auto* row = transitionMatrix + i * N;
+            dtype rowDot = 0.0;
+            for (std::size_t j = 0; j < N; j++) {
+                rowDot += row[j] * w[j];
+            }
+            sum += alphaRow[i] * rowDot;
+        }
+        const auto invSum = static_cast<dtype>(1) / sum;
+        for (std::size_t i = 0; i < N; i++) {
+            const auto alphaIScaled = alphaRow[i] * invSum;
+            const auto* row = transitionMatrix + i * N;
+            auto* countsRow = counts + i * N;
+            for (std::size_t j = 0; j < N; j++) {
+                countsRow[j] += alphaIScaled * row[j] * w[j];
+            }
+        }
+    }
+}
+
+template<typename dtype>
+void eStepImpl(const dtype* const alpha, const dtype* const beta, const dtype* const transitionMatrix,
+               const dtype* const pObs, dtype* const gamma, dtype* const counts, std::size_t N, std::size_t T) {
+    std::fill(counts, counts + N * N, 0.0);
+
+    auto wData = std::unique_ptr<dtype[]>(new dtype[N]);
+    auto* w = wData.get();
+
+    // first gamma row has no associated transition and is handled separately
+    {
+        dtype rowSum = 0;
+        for (std::size_t n = 0; n < N; ++n) {
+            gamma[n] = alpha[n] * beta[n];
+            rowSum += gamma[n];
+        }
+        if (rowSum != 0.) {
+            const auto invRowSum = static_cast<dtype>(1) / rowSum;
+            for (std::size_t n = 0; n < N; ++n) {
+                gamma[n] *= invRowSum;
+            }
+        }
+    }
 
     for (std::size_t t = 0; t < T - 1; t++) {
-        sum = 0.0;
+        const auto* alphaRow = alpha + t * N;
+        const auto* alphaNext = alpha + (t + 1) * N;
+        const auto* betaNext = beta + (t + 1) * N;
+        const auto* pObsNext = pObs + (t + 1) * N;
+        auto* gammaNext = gamma + (t + 1) * N;
+
+        // the beta row is loaded once and feeds both the weight row of the count update and the
+        // next gamma row, halving the traffic compared to running the two kernels back-to-back
+        dtype rowSum = 0;
+        for (std::size_t j = 0; j < N; j++) {
+            const auto betaJ = betaNext[j];
+            w[j] = pObsNext[j] * betaJ;
+            gammaNext[j] = alphaNext[j] * betaJ;
+            rowSum += gammaNext[j];
+        }
+        if (rowSum != 0.) {
+            const auto invRowSum = static_cast<dtype>(1) / rowSum;
+            for (std::size_t j = 0; j < N; j++) {
+                gammaNext[j] *= invRowSum;
+            }
+        }
+
+        // normalizer-first count update, cf. transitionCountsImpl
+        dtype sum = 0.0;
         for (std::size_t i = 0; i < N; i++) {
+            const auto* row = transitionMatrix + i * N;
+            dtype rowDot = 0.0;
             for (std::size_t j = 0; j < N; j++) {
-                tmp[i * N + j] =
-                        alpha[t * N + i] * transitionMatrix[i * N + j] * pObs[(t + 1) * N + j] *
-                        beta[(t + 1) * N + j];
-                sum += tmp[i * N + j];
+                rowDot += row[j] * w[j];
             }
+            sum += alphaRow[i] * rowDot;
         }
+        const auto invSum = static_cast<dtype>(1) / sum;
         for (std::size_t i = 0; i < N; i++) {
+            const auto alphaIScaled = alphaRow[i] * invSum;
+            const auto* row = transitionMatrix + i * N;
+            auto* countsRow = counts + i * N;
             for (std::size_t j = 0; j < N; j++) {
-                counts[i * N + j] += tmp[i * N + j] / sum;
+                countsRow[j] += alphaIScaled * row[j] * w[j];
             }
         }
     }
@@ -336,6 +548,7 @@ void transitionCounts(const np_array<dtype> &alpha, const np_array<dtype> &beta,
 
     auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
 
+    py::gil_scoped_release gil;
     transitionCountsImpl(alphaBuf, betaBuf, transitionMatrixPtr, pObsBuf, countsBuf, N, T);
 }
 
@@ -345,6 +558,21 @@ void samplePathImpl(const dtype* const alpha, const dtype* const transitionMatri
     auto pselPtr = std::unique_ptr<dtype[]>(new dtype[N]);
     auto psel = pselPtr.get();
 
+    // all T uniform variates are drawn up front in one tight loop, so the backward recursion below
+    // only performs the cumulative sums and searches and the generator state stays out of the hot loop
+    auto uPtr = std::unique_ptr<dtype[]>(new dtype[T]);
+    auto* u = uPtr.get();
+    std::uniform_real_distribution<dtype> uniform(0, 1);
+    for (std::size_t t = 0; t < T; ++t) {
+        u[t] = uniform(generator);
+    }
+
+    auto sample = [N, psel](dtype variate) {
+        auto p = variate * psel[N - 1];  // uniform between 0 and psel[N-1] which is cumulative
+        auto it = std::lower_bound(psel, psel + N, p);
+        return std::distance(psel, it);
+    };
+
     // Sample final state.
     for (std::size_t i = 0; i < N; i++) {
         psel[i] = alpha[(T-1)*N + i];
@@ -353,15 +581,8 @@ void samplePathImpl(const dtype* const alpha, const dtype* const transitionMatri
         }
     }
 
-    auto sample = [&generator, N, psel]() {
-        static thread_local std::uniform_real_distribution<dtype> uiDist (0, 1);
-        auto p = uiDist(generator) * psel[N - 1];  // uniform between 0 and psel[N-1] which is cumulative
-        auto it = std::lower_bound(psel, psel + N, p);
-        return std::distance(psel, it);
-    };
-
     // Draw from this distribution.
-    path[T - 1] = sample();
+    path[T - 1] = sample(u[T - 1]);
 
     // Work backwards from T-2 to 0.
     for (std::int64_t t = T - 2; t >= 0; --t) {
@@ -374,23 +595,29 @@ void samplePathImpl(const dtype* const alpha, const dtype* const transitionMatri
         }
 
         // Draw from this distribution.
-        path[t] = sample();
+        path[t] = sample(u[t]);
     }
 }
 
 template<typename dtype>
-np_array<std::int32_t>
-samplePath(const np_array<dtype> &alpha, const np_array<dtype> &transitionMatrix, std::size_t T, int seed = -1) {
+np_array_nfc<std::int32_t>
+samplePath(const np_array<dtype> &alpha, const np_array<dtype> &transitionMatrix, std::size_t T, int seed = -1,
+           const py::object &pathOut = py::none()) {
     auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
 
-    np_array<std::int32_t> pathArray(std::vector<std::size_t>{T});
+    auto pathArray = detail::pathOutputArray(pathOut, T);
     auto path = pathArray.mutable_data();
+    const auto* alphaBuf = alpha.data();
+    const auto* ABuf = transitionMatrix.data();
 
     if (seed < 0) {
-        samplePathImpl(alpha.data(), transitionMatrix.data(), N, T, deeptime::rnd::staticThreadLocalGenerator(), path);
+        auto& generator = deeptime::rnd::staticThreadLocalGenerator();
+        py::gil_scoped_release gil;
+        samplePathImpl(alphaBuf, ABuf, N, T, generator, path);
     } else {
         auto generator = deeptime::rnd::seededGenerator(static_cast<std::uint32_t>(seed));
-        samplePathImpl(alpha.data(), transitionMatrix.data(), N, T, generator, path);
+        py::gil_scoped_release gil;
+        samplePathImpl(alphaBuf, ABuf, N, T, generator, path);
     }
     return pathArray;
 }
@@ -448,11 +675,85 @@ dtype forwardBackward(const np_array<dtype> &transitionMatrix, const np_array<dt
     auto* gammaBuf = gamma.mutable_data();
     auto* countsBuf = counts.mutable_data();
 
+    py::gil_scoped_release gil;
     auto logprob = forwardImpl(P, pObsBuf, piBuf, alphaBuf, N, T);
     backwardImpl(P, pObsBuf, betaBuf, N, T);
-    stateProbabilitiesImpl(alphaBuf, betaBuf, gammaBuf, N, T);
-    transitionCountsImpl(alphaBuf, betaBuf, P, pObsBuf, countsBuf, N, T);
+    eStepImpl(alphaBuf, betaBuf, P, pObsBuf, gammaBuf, countsBuf, N, T);
     return logprob;
 }
 
+template<typename dtype>
+np_array<dtype> forwardBackwardBatch(const np_array<dtype> &transitionMatrix, const py::list &pObs,
+                                     const np_array<dtype> &pi, const py::list &gammas, const py::list &counts) {
+    auto N = static_cast<std::size_t>(transitionMatrix.shape(0));
+    auto nTrajs = pObs.size();
+    if (gammas.size() != nTrajs || counts.size() != nTrajs) {
+        throw std::invalid_argument("Number of gamma and count matrices must match the number of trajectories.");
+    }
+    // hold references to the arrays so that the raw pointers stay valid, reject anything that would force a copy
+    std::vector<np_array_nfc<dtype>> pObsArrays, gammaArrays, countArrays;
+    pObsArrays.reserve(nTrajs);
+    gammaArrays.reserve(nTrajs);
+    countArrays.reserve(nTrajs);
+    for (std::size_t k = 0; k < nTrajs; ++k) {
+        for (const auto &element : {pObs[k], gammas[k], counts[k]}) {
+            if (!py::isinstance<np_array_nfc<dtype>>(element)) {
+                throw std::invalid_argument("All state probability trajectories, gamma, and count matrices must be "
+                                            "contiguous arrays of matching dtype.");
+            }
+        }
+        pObsArrays.push_back(pObs[k].cast<np_array_nfc<dtype>>());
+        gammaArrays.push_back(gammas[k].cast<np_array_nfc<dtype>>());
+        countArrays.push_back(counts[k].cast<np_array_nfc<dtype>>());
+        const auto &pObsK = pObsArrays.back();
+        if (pObsK.ndim() != 2 || static_cast<std::size_t>(pObsK.shape(1)) != N) {
+            throw std::invalid_argument("Each state probability trajectory must be of shape (T, N).");
+        }
+        if (pObsK.shape(0) == 0) {
+            throw std::invalid_argument("Needs T to be at least 1, i.e., no empty trajectories permitted.");
+        }
+        if (gammaArrays.back().ndim() != 2 || gammaArrays.back().shape(0) != pObsK.shape(0) ||
+            gammaArrays.back().shape(1) != pObsK.shape(1)) {
+            throw std::invalid_argument("Each gamma must have the same shape as its state probability trajectory.");
+        }
+        if (countArrays.back().ndim() != 2 || static_cast<std::size_t>(countArrays.back().shape(0)) != N ||
+            static_cast<std::size_t>(countArrays.back().shape(1)) != N) {
+            throw std::invalid_argument("Each count matrix must be of shape (N, N).");
+        }
+    }
+
+    std::vector<const dtype*> pObsBufs(nTrajs);
+    std::vector<dtype*> gammaBufs(nTrajs);
+    std::vector<dtype*> countBufs(nTrajs);
+    std::vector<std::size_t> lengths(nTrajs);
+    for (std::size_t k = 0; k < nTrajs; ++k) {
+        pObsBufs[k] = pObsArrays[k].data();
+        gammaBufs[k] = gammaArrays[k].mutable_data();
+        countBufs[k] = countArrays[k].mutable_data();
+        lengths[k] = static_cast<std::size_t>(pObsArrays[k].shape(0));
+    }
+
+    np_array<dtype> logprobs(std::vector<std::size_t>{nTrajs});
+    auto* logprobsBuf = logprobs.mutable_data();
+    const auto* P = transitionMatrix.data();
+    const auto* piBuf = pi.data();
+    {
+        py::gil_scoped_release gil;
+        const dtype* const* pObsPtrs = pObsBufs.data();
+        dtype* const* gammaPtrs = gammaBufs.data();
+        dtype* const* countPtrs = countBufs.data();
+        const std::size_t* lengthsPtr = lengths.data();
+        #pragma omp parallel for default(none) firstprivate(nTrajs, N, P, piBuf, logprobsBuf, pObsPtrs, gammaPtrs, countPtrs, lengthsPtr)
+        for (std::size_t k = 0; k < nTrajs; ++k) {
+            const auto T = lengthsPtr[k];
+            auto alpha = std::unique_ptr<dtype[]>(new dtype[T * N]);
+            auto beta = std::unique_ptr<dtype[]>(new dtype[T * N]);
+            logprobsBuf[k] = forwardImpl(P, pObsPtrs[k], piBuf, alpha.get(), N, T);
+            backwardImpl(P, pObsPtrs[k], beta.get(), N, T);
+            eStepImpl(alpha.get(), beta.get(), P, pObsPtrs[k], gammaPtrs[k], countPtrs[k], N, T);
+        }
+    }
+    return logprobs;
+}
+
 }
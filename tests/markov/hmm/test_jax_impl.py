@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+pytest.importorskip("jax")
+
+import jax
+
+jax.config.update('jax_enable_x64', True)
+
+import deeptime.markov.hmm._hmm_bindings as _bindings
+from deeptime.markov.hmm import _jax_impl
+
+
+@pytest.fixture
+def random_model():
+    rng = np.random.RandomState(42)
+    n_states, length = 4, 100
+    transition_matrix = rng.uniform(size=(n_states, n_states))
+    transition_matrix /= transition_matrix.sum(axis=1, keepdims=True)
+    state_probabilities = rng.uniform(size=(length, n_states))
+    initial_distribution = rng.uniform(size=(n_states,))
+    initial_distribution /= initial_distribution.sum()
+    return transition_matrix, state_probabilities, initial_distribution
+
+
+def test_forward_matches_binding(random_model):
+    transition_matrix, state_probabilities, initial_distribution = random_model
+    alpha_ref = np.zeros_like(state_probabilities)
+    logprob_ref = _bindings.util.forward(transition_matrix, state_probabilities, initial_distribution,
+                                         alpha_out=alpha_ref)
+    logprob, alpha = _jax_impl.forward(transition_matrix, state_probabilities, initial_distribution)
+    assert_almost_equal(logprob, logprob_ref)
+    assert_array_almost_equal(alpha, alpha_ref)
+
+
+def test_backward_matches_binding(random_model):
+    transition_matrix, state_probabilities, _ = random_model
+    beta_ref = np.zeros_like(state_probabilities)
+    _bindings.util.backward(transition_matrix, state_probabilities, beta_out=beta_ref)
+    beta = _jax_impl.backward(transition_matrix, state_probabilities)
+    assert_array_almost_equal(beta, beta_ref)
+
+
+@pytest.mark.parametrize("length", [100, 2, 1], ids=lambda length: f"T={length}")
+def test_forward_parallel_matches_sequential(random_model, length):
+    transition_matrix, state_probabilities, initial_distribution = random_model
+    state_probabilities = state_probabilities[:length]
+    logprob_ref, alpha_ref = _jax_impl.forward(transition_matrix, state_probabilities, initial_distribution)
+    logprob, alpha = _jax_impl.forward_parallel(transition_matrix, state_probabilities, initial_distribution)
+    assert_almost_equal(logprob, logprob_ref)
+    assert_array_almost_equal(alpha, alpha_ref)
+
+
+def test_backward_parallel_matches_sequential(random_model):
+    transition_matrix, state_probabilities, _ = random_model
+    beta_ref = _jax_impl.backward(transition_matrix, state_probabilities)
+    beta = _jax_impl.backward_parallel(transition_matrix, state_probabilities)
+    assert_array_almost_equal(beta, beta_ref)
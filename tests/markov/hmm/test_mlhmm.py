@@ -119,6 +119,115 @@ class TestAlgorithmsAgainstReference(unittest.TestCase):
         np.testing.assert_array_equal(path, self.dtraj)
 
 
+def random_hmm_kernel_input(seed=17, n_states=3, lengths=(25, 50, 5)):
+    rng = np.random.RandomState(seed)
+    transition_matrix = rng.uniform(size=(n_states, n_states))
+    transition_matrix /= transition_matrix.sum(axis=1, keepdims=True)
+    initial_distribution = rng.uniform(size=(n_states,))
+    initial_distribution /= initial_distribution.sum()
+    pobs = [rng.uniform(size=(length, n_states)) for length in lengths]
+    return transition_matrix, initial_distribution, pobs
+
+
+def test_forward_backward_batch():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input()
+    n_states = transition_matrix.shape[0]
+    gammas = [np.empty_like(p) for p in pobs]
+    counts = [np.empty((n_states, n_states)) for _ in pobs]
+    logprobs = _bindings.util.forward_backward_batch(transition_matrix, pobs, initial_distribution, gammas, counts)
+    assert_equal(len(logprobs), len(pobs))
+    for p, gamma, count, logprob in zip(pobs, gammas, counts, logprobs):
+        alpha = np.zeros_like(p)
+        beta = np.zeros_like(p)
+        logprob_ref = _bindings.util.forward(transition_matrix, p, initial_distribution, alpha_out=alpha)
+        _bindings.util.backward(transition_matrix, p, beta_out=beta)
+        gamma_ref = np.zeros_like(p)
+        _bindings.util.state_probabilities(alpha, beta, gamma_out=gamma_ref)
+        count_ref = np.zeros((n_states, n_states))
+        _bindings.util.transition_counts(alpha, beta, transition_matrix, p, counts_out=count_ref)
+        np.testing.assert_array_almost_equal(logprob, logprob_ref)
+        np.testing.assert_array_almost_equal(gamma, gamma_ref)
+        np.testing.assert_array_almost_equal(count, count_ref)
+
+
+def test_forward_backward_batch_rejects_nonconforming_arrays():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input()
+    n_states = transition_matrix.shape[0]
+    gammas = [np.empty_like(p) for p in pobs]
+    counts = [np.empty((n_states, n_states)) for _ in pobs]
+    with assert_raises(ValueError):  # mismatching number of gammas
+        _bindings.util.forward_backward_batch(transition_matrix, pobs, initial_distribution, gammas[:-1], counts)
+    with assert_raises(ValueError):  # wrong dtype would silently land the result in a converted copy
+        bad_gammas = [gammas[0].astype(np.float32)] + gammas[1:]
+        _bindings.util.forward_backward_batch(transition_matrix, pobs, initial_distribution, bad_gammas, counts)
+    with assert_raises(ValueError):  # non-contiguous output buffer
+        bad_gammas = [np.empty((len(pobs[0]), 2 * n_states))[:, ::2]] + gammas[1:]
+        _bindings.util.forward_backward_batch(transition_matrix, pobs, initial_distribution, bad_gammas, counts)
+    with assert_raises(ValueError):  # wrong count matrix shape
+        bad_counts = [np.empty((n_states, n_states + 1))] + counts[1:]
+        _bindings.util.forward_backward_batch(transition_matrix, pobs, initial_distribution, gammas, bad_counts)
+    with assert_raises(ValueError):  # empty trajectory
+        _bindings.util.forward_backward_batch(transition_matrix, [pobs[0][:0]] + pobs[1:], initial_distribution,
+                                              [gammas[0][:0]] + gammas[1:], counts)
+
+
+def test_viterbi_batch():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input(seed=23)
+    paths = _bindings.util.viterbi_batch(transition_matrix, pobs, initial_distribution)
+    assert_equal(len(paths), len(pobs))
+    for p, path in zip(pobs, paths):
+        path_ref = _bindings.util.viterbi(transition_matrix, p, initial_distribution)
+        assert_array_equal(path, path_ref)
+
+
+def test_viterbi_batch_rejects_shape_mismatch():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input(seed=23)
+    with assert_raises(ValueError):  # trajectory with wrong number of states
+        _bindings.util.viterbi_batch(transition_matrix, [pobs[0][:, :-1]], initial_distribution)
+    with assert_raises(ValueError):  # empty trajectory
+        _bindings.util.viterbi_batch(transition_matrix, [pobs[0][:0]], initial_distribution)
+
+
+def test_viterbi_path_out():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input(seed=31, lengths=(40,))
+    p = pobs[0]
+    path_ref = _bindings.util.viterbi(transition_matrix, p, initial_distribution)
+    buffer = np.empty(len(p), dtype=np.int32)
+    path = _bindings.util.viterbi(transition_matrix, p, initial_distribution, path_out=buffer)
+    assert_(np.shares_memory(path, buffer))
+    assert_array_equal(buffer, path_ref)
+    buffer.fill(-1)
+    path = viterbi(transition_matrix, p, initial_distribution, path=buffer)
+    assert_(np.shares_memory(path, buffer))
+    assert_array_equal(buffer, path_ref)
+
+
+def test_sample_path_out():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input(seed=31, lengths=(40,))
+    p = pobs[0]
+    alpha = np.zeros_like(p)
+    _bindings.util.forward(transition_matrix, p, initial_distribution, alpha_out=alpha)
+    buffer = np.empty(len(p), dtype=np.int32)
+    path = _bindings.util.sample_path(alpha, transition_matrix, len(p), seed=42, path_out=buffer)
+    assert_(np.shares_memory(path, buffer))
+    assert_(np.all(buffer >= 0))
+    assert_(np.all(buffer < transition_matrix.shape[0]))
+
+
+def test_path_out_rejects_nonconforming_buffers():
+    transition_matrix, initial_distribution, pobs = random_hmm_kernel_input(seed=31, lengths=(40,))
+    p = pobs[0]
+    with assert_raises(ValueError):  # wrong dtype
+        _bindings.util.viterbi(transition_matrix, p, initial_distribution,
+                               path_out=np.empty(len(p), dtype=np.int64))
+    with assert_raises(ValueError):  # wrong length
+        _bindings.util.viterbi(transition_matrix, p, initial_distribution,
+                               path_out=np.empty(len(p) + 1, dtype=np.int32))
+    with assert_raises(ValueError):  # non-contiguous
+        _bindings.util.viterbi(transition_matrix, p, initial_distribution,
+                               path_out=np.empty(2 * len(p), dtype=np.int32)[::2])
+
+
 class TestMLHMM(unittest.TestCase):
 
     @classmethod